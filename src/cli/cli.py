@@ -1,117 +1,55 @@
+import importlib
+from typing import Dict, List, Optional
+
 import click
-import sys
 import logging
 
-from core.storage.WavesLabRepository import repository
-
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
-@click.group()
-@click.version_option(version='1.0.0')
-def waveslab():
-    """
-    WavesLab Simulation Environment CLI
-
-    Control WaveNodes and manage virtual users in the household simulation.
-    """
-    pass
-
-@waveslab.command()
-@click.argument('node_id')
-@click.option('--user', '-u', help='Associate a user with this node')
-def start(node_id: str, user: str = None):
-    """
-    Start a WaveNode by id.
-
-    id: The id of the WaveNode to start
-
-    Examples:
-        waveslab start "living-room-light"
-        waveslab start "kitchen-faucet" --user alice
-    """
-    try:
-        success, message = repository.start_node(node_id, user)
+class LazyGroup(click.Group):
+    """Click group that imports a subcommand's module only when that subcommand is used."""
 
-        if success:
-            click.echo(message)
-            sys.exit(0)
-        else:
-            click.echo(f"Error: {message}", err=True)
-            sys.exit(1)
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name to the module defining a click command of the same name
+        self._lazy_commands = lazy_commands or {}
 
-    except Exception as e:
-        logger.error(f"Unexpected error starting node '{node_id}': {e}")
-        click.echo(f"Unexpected error: {e}", err=True)
-        sys.exit(1)
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | self._lazy_commands.keys())
 
-@waveslab.command()
-@click.argument('node_id')
-def stop(node_id: str):
-    """
-    Stop a WaveNode by id.
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self._lazy_commands:
+            module = importlib.import_module(self._lazy_commands[cmd_name])
+            return getattr(module, cmd_name)
+        return super().get_command(ctx, cmd_name)
 
-    id: The id of the WaveNode to stop
 
-    Examples:
-        waveslab stop "living-room-light"
-        waveslab stop "kitchen-faucet"
+@click.group(
+    cls=LazyGroup,
+    lazy_commands={
+        'start': 'cli.commands.start',
+        'stop': 'cli.commands.stop',
+        'status': 'cli.commands.status',
+        'users': 'cli.commands.users',
+        'dump': 'cli.commands.dump',
+    },
+)
+@click.version_option(version='1.0.0')
+@click.pass_context
+def waveslab(ctx: click.Context):
     """
-    try:
-        success, message = repository.stop_node(node_id)
-
-        if success:
-            click.echo(message)
-            sys.exit(0)
-        else:
-            click.echo(f"Error: {message}", err=True)
-            sys.exit(1)
-
-    except Exception as e:
-        logger.error(f"Unexpected error starting node '{node_id}': {e}")
-        click.echo(f"Unexpected error: {e}", err=True)
-        sys.exit(1)
-
-
-@waveslab.command()
-def status():
-    try:
-        nodes = repository.get_all_nodes()
-        if not nodes:
-            click.echo("No WaveNodes found.")
-            return
-
-        click.echo("\nWaveNodes:")
-        click.echo("-" * 60)
-
-        for node in nodes:
-            click.echo(f"{node.status.lower()} - {node.name}")
-    except Exception as e:
-        logger.error(f"Error listing nodes: {e}")
-        click.echo(f"Error listing nodes: {e}", err=True)
-        sys.exit(1)
+    WavesLab Simulation Environment CLI
 
-@waveslab.command()
-def users():
-    """
-    List all VirtualUsers in the system.
+    Control WaveNodes and manage virtual users in the household simulation.
     """
-    try:
-        list_of_users = repository.get_all_users()
-
-        if not list_of_users:
-            click.echo("No VirtualUsers found.")
-            return
-
-        click.echo("\nVirtual Users:")
-        click.echo("-" * 30)
+    # Runs even when a command exits via sys.exit
+    ctx.call_on_close(_flush_repository)
 
-        for user in list_of_users:
-            click.echo(f"• {user.username}")
 
-    except Exception as e:
-        logger.error(f"Error listing users: {e}")
-        click.echo(f"Error listing users: {e}", err=True)
-        sys.exit(1)
\ No newline at end of file
+def _flush_repository():
+    # Imported here so commands that never load the repository stay lazy
+    from core.storage.WavesLabRepository import flush_repository
+    flush_repository()
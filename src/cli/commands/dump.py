@@ -0,0 +1,29 @@
+import click
+import sys
+import logging
+
+import orjson
+
+from core.storage.WavesLabRepository import get_repository
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.option('--pretty', is_flag=True, help='Indent the output for reading')
+def dump(pretty: bool = False):
+    """
+    Print all WaveNodes as JSON.
+
+    Examples:
+        waveslab dump
+        waveslab dump --pretty
+    """
+    try:
+        nodes = get_repository().get_all_nodes()
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        click.echo(orjson.dumps([node.model_dump(mode='json') for node in nodes], option=option).decode())
+    except Exception as e:
+        logger.error(f"Error dumping nodes: {e}")
+        click.echo(f"Error dumping nodes: {e}", err=True)
+        sys.exit(1)
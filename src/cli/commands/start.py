@@ -0,0 +1,36 @@
+import click
+import sys
+import logging
+
+from core.storage.WavesLabRepository import get_repository
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.argument('node_id')
+@click.option('--user', '-u', help='Associate a user with this node')
+def start(node_id: str, user: str = None):
+    """
+    Start a WaveNode by id.
+
+    id: The id of the WaveNode to start
+
+    Examples:
+        waveslab start "living-room-light"
+        waveslab start "kitchen-faucet" --user alice
+    """
+    try:
+        success, message = get_repository().start_node(node_id, user)
+
+        if success:
+            click.echo(message)
+            sys.exit(0)
+        else:
+            click.echo(f"Error: {message}", err=True)
+            sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"Unexpected error starting node '{node_id}': {e}")
+        click.echo(f"Unexpected error: {e}", err=True)
+        sys.exit(1)
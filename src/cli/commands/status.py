@@ -0,0 +1,26 @@
+import click
+import sys
+import logging
+
+from core.storage.WavesLabRepository import get_repository
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+def status():
+    try:
+        nodes = get_repository().get_all_nodes()
+        if not nodes:
+            click.echo("No WaveNodes found.")
+            return
+
+        click.echo("\nWaveNodes:")
+        click.echo("-" * 60)
+
+        for node in nodes:
+            click.echo(f"{node.status.lower()} - {node.name}")
+    except Exception as e:
+        logger.error(f"Error listing nodes: {e}")
+        click.echo(f"Error listing nodes: {e}", err=True)
+        sys.exit(1)
@@ -0,0 +1,35 @@
+import click
+import sys
+import logging
+
+from core.storage.WavesLabRepository import get_repository
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+@click.argument('node_id')
+def stop(node_id: str):
+    """
+    Stop a WaveNode by id.
+
+    id: The id of the WaveNode to stop
+
+    Examples:
+        waveslab stop "living-room-light"
+        waveslab stop "kitchen-faucet"
+    """
+    try:
+        success, message = get_repository().stop_node(node_id)
+
+        if success:
+            click.echo(message)
+            sys.exit(0)
+        else:
+            click.echo(f"Error: {message}", err=True)
+            sys.exit(1)
+
+    except Exception as e:
+        logger.error(f"Unexpected error starting node '{node_id}': {e}")
+        click.echo(f"Unexpected error: {e}", err=True)
+        sys.exit(1)
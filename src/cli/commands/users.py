@@ -0,0 +1,31 @@
+import click
+import sys
+import logging
+
+from core.storage.WavesLabRepository import get_repository
+
+logger = logging.getLogger(__name__)
+
+
+@click.command()
+def users():
+    """
+    List all VirtualUsers in the system.
+    """
+    try:
+        list_of_users = get_repository().get_all_users()
+
+        if not list_of_users:
+            click.echo("No VirtualUsers found.")
+            return
+
+        click.echo("\nVirtual Users:")
+        click.echo("-" * 30)
+
+        for user in list_of_users:
+            click.echo(f"• {user.username}")
+
+    except Exception as e:
+        logger.error(f"Error listing users: {e}")
+        click.echo(f"Error listing users: {e}", err=True)
+        sys.exit(1)
@@ -1,7 +1,7 @@
 import re
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from core.model.NodeStatus import NodeStatus
 from core.model.NodeType import NodeType
@@ -9,6 +9,10 @@ from core.model.NodeType import NodeType
 
 class WaveNode(BaseModel):
     """Model representing a WaveNode - a smart furniture connection."""
+    # Instances are shared between threads by the repository; changes build a
+    # new node rather than mutating one, so readers never see a node mid-update
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="Slugified version of the name")
     name: str = Field(..., description="Unique human-readable identifier")
     node_type: NodeType = Field(..., description="Type of utility consumed")
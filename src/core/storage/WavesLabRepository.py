@@ -1,67 +1,179 @@
-from typing import Dict, List, Optional
+from functools import cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 import logging
-import json
 from pathlib import Path
 
+import orjson
+
 from core.model.NodeStatus import NodeStatus
+from core.model.NodeType import NodeType
 from core.model.VirtualUser import VirtualUser
 from core.model.WaveNode import WaveNode
 import os
-from threading import Lock
+import time
+from threading import RLock, Timer
 
 logger = logging.getLogger(__name__)
 
+# model_construct does not coerce, so enum strings are mapped up front.
+# Both the canonical value ("on") and the legacy name ("ON") are keys, so the
+# common spellings resolve without allocating a lowercased copy.
+_STATUS_BY_STR = {**{s.name: s for s in NodeStatus}, **{s.value: s for s in NodeStatus}}
+_NODE_TYPE_BY_STR = {**{t.name: t for t in NodeType}, **{t.value: t for t in NodeType}}
+
+# nodes.json is rewritten in place, so a read can catch it half-written;
+# such reads are retried this many times in total, this many seconds apart
+_NODES_READ_ATTEMPTS = 3
+_NODES_READ_RETRY_DELAY = 0.01
+
+
+def _to_enum(lookup: Dict[str, Any], value: str):
+    member = lookup.get(value)
+    return member if member is not None else lookup[value.lower()]
+
+
+class _NodesSnapshot(NamedTuple):
+    """Nodes published to readers, with the IDs of the active ones in file order."""
+    nodes: Dict[str, WaveNode]
+    active_ids: Tuple[str, ...]
+
+    @classmethod
+    def build(cls, nodes: Dict[str, WaveNode]) -> "_NodesSnapshot":
+        return cls(nodes, tuple(node_id for node_id, node in nodes.items() if node.status == NodeStatus.ON))
+
+
 class WavesLabRepository:
     """Repository for WaveNodes and VirtualUsers with JSON persistence."""
 
-    def __init__(self, data_dir: str = "core/storage/"):
+    def __init__(self, data_dir: str = "core/storage/", durable: bool = False, reload_interval: float = 1.0,
+                 flush_delay: float = 0.05, pretty: bool = False):
         self._data_dir = Path(data_dir)
+        # fsync every save; off by default since os.replace already keeps
+        # the swap atomic and this is local simulation state
+        self._durable = durable
+        # Indent the JSON files for reading by hand; compact by default, since
+        # `waveslab dump --pretty` shows the data in readable form
+        self._pretty = pretty
         # Use .json files as requested
         self._nodes_file = self._data_dir / "nodes.json"
         self._users_file = self._data_dir / "users.json"
 
-        # Do NOT create directories or seed data. Only use existing data.
-        # Validate presence early to avoid surprising behavior later.
-        if not self._users_file.exists():
-            raise FileNotFoundError(f"Users file not found: {self._users_file}")
-        if not self._nodes_file.exists():
-            raise FileNotFoundError(f"Nodes file not found: {self._nodes_file}")
-
-        # Single lock for all operations
-        self._lock = Lock()
+        # Serializes writers and reloads. Readers never take it: they read
+        # the published snapshot dicts, which are replaced, never mutated.
+        self._lock = RLock()
+
+        # Parsed objects are kept in memory; files are only re-read when
+        # their mtime changes (e.g. another process wrote them). Readers check
+        # the mtime at most once per reload_interval seconds; writers always do.
+        # Do NOT create directories or seed data: these stats raise
+        # FileNotFoundError early if the data files are missing.
+        self._reload_interval = reload_interval
+        self._nodes_mtime = self._nodes_file.stat().st_mtime_ns
+        self._nodes_next_check = time.monotonic() + reload_interval
+        try:
+            nodes = self._read_nodes_retrying()
+        except Exception as e:
+            logger.error("Error loading nodes: %s", e)
+            nodes = {}
+            # Reload on the next access rather than serving no nodes until
+            # nodes.json happens to change again
+            self._nodes_mtime = None
+            self._nodes_next_check = time.monotonic()
+        self._nodes_snapshot = _NodesSnapshot.build(nodes)
+        self._users_mtime = self._users_file.stat().st_mtime_ns
+        self._users_next_check = time.monotonic() + reload_interval
+        self._users_snapshot: Dict[str, VirtualUser] = self._load_users()
+
+        # Encoded nodes.json entry per node ID, tagged with the node object it
+        # was encoded from. Nodes are replaced rather than mutated, so an
+        # identity match means the entry is still current.
+        self._node_rows: Dict[str, Tuple[WaveNode, bytes]] = {}
+
+        # nodes.json is kept open so non-durable saves can rewrite it in place.
+        # Opened (for writing) on the first such save, so read-only use of the
+        # repository works with read-only data files.
+        self._nodes_fp = None
+
+        # Non-durable node saves are deferred by flush_delay seconds so that
+        # back-to-back changes are written once; see flush_now()
+        self._flush_delay = flush_delay
+        # IDs of nodes changed in memory but not yet written
+        self._dirty_node_ids: Set[str] = set()
+        self._flush_timer: Optional[Timer] = None
 
     # ---------------------------
     # Low-level JSON I/O helpers
     # ---------------------------
 
+    @staticmethod
+    def _mtime_ns(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError as e:
+            logger.error("Error reading mtime of %s: %s", path, e)
+            return None
+
     def _read_json(self, path: Path):
-        with open(path, "r", encoding="utf-8") as fp:
-            return json.load(fp)
+        return orjson.loads(path.read_bytes())
+
+    def _close_nodes_fp(self):
+        """Close the persistent nodes.json handle, e.g. because the file was replaced."""
+        if self._nodes_fp is not None:
+            self._nodes_fp.close()
+            self._nodes_fp = None
 
-    def _write_json_atomic(self, path: Path, data):
+    def _write_nodes_in_place(self, payload: bytes):
+        """
+        Overwrite nodes.json through the persistent handle, opening it if needed.
+
+        Not atomic: another process may briefly see a partial file, which
+        _get_nodes_snapshot tolerates by keeping its snapshot and retrying.
+        """
+        if self._nodes_fp is None:
+            self._nodes_fp = open(self._nodes_file, "r+b")
+        fp = self._nodes_fp
+        fp.seek(0)
+        fp.write(payload)
+        fp.truncate()
+        fp.flush()
+
+    def _write_json_atomic(self, path: Path, data, fsync: bool = False):
+        option = orjson.OPT_INDENT_2 if self._pretty else 0
+        self._write_bytes_atomic(path, orjson.dumps(data, option=option), fsync=fsync)
+
+    def _write_bytes_atomic(self, path: Path, payload: bytes, fsync: bool = False):
         """
         Atomic write: write to a temp file in the same dir,
-        fsync it, then os.replace to ensure atomic swap.
+        optionally fsync it, then os.replace to ensure atomic swap.
         """
         tmp_path = path.with_suffix(path.suffix + ".tmp")
-        with open(tmp_path, "w", encoding="utf-8") as tf:
-            json.dump(data, tf, indent=2)
-            tf.flush()
-            os.fsync(tf.fileno())
+        with open(tmp_path, "wb") as tf:
+            tf.write(payload)
+            if fsync:
+                tf.flush()
+                os.fsync(tf.fileno())
         # Atomic replace
         os.replace(tmp_path, path)
 
+    def _fsync_dir(self):
+        """fsync the data directory so completed renames are durable."""
+        fd = os.open(self._data_dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
     # ---------------------------
     # Load/Save domain objects
     # ---------------------------
 
     def _load_users(self) -> Dict[str, VirtualUser]:
-        """Load users from users.json."""
+        """Load users from users.json, trusting its contents (no validation)."""
         try:
             users_data = self._read_json(self._users_file)
             users: Dict[str, VirtualUser] = {}
             for user_dict in users_data:
-                user = VirtualUser(**user_dict)
+                user = VirtualUser.model_construct(**user_dict)
                 users[user.username] = user
             logger.debug("Loaded %d users from %s", len(users), self._users_file)
             return users
@@ -69,95 +181,281 @@ class WavesLabRepository:
             logger.error("Error loading users: %s", e)
             return {}
 
-    def _load_nodes(self) -> Dict[str, WaveNode]:
-        """Load nodes from nodes.json."""
-        try:
-            nodes_data = self._read_json(self._nodes_file)
-            nodes: Dict[str, WaveNode] = {}
-            for node_dict in nodes_data:
-                # Normalize nullable endpoint
-                if node_dict.get("endpoint") is None:
-                    node_dict["endpoint"] = ""
-
-                # Normalize enums to lowercase strings if present
-                if isinstance(node_dict.get("status"), str):
-                    node_dict["status"] = node_dict["status"].lower()
-                if isinstance(node_dict.get("node_type"), str):
-                    node_dict["node_type"] = node_dict["node_type"].lower()
-
-                node = WaveNode(**node_dict)
-                nodes[node.id] = node
-            logger.debug("Loaded %d nodes from %s", len(nodes), self._nodes_file)
-            return nodes
-        except Exception as e:
-            logger.error("Error loading nodes: %s", e)
-            return {}
+    def _read_nodes(self) -> Dict[str, WaveNode]:
+        """Read nodes from nodes.json, trusting its contents (no validation)."""
+        nodes_data = self._read_json(self._nodes_file)
+        nodes: Dict[str, WaveNode] = {}
+        for node_dict in nodes_data:
+            # Normalize nullable endpoint
+            if node_dict.get("endpoint") is None:
+                node_dict["endpoint"] = ""
+
+            # Normalize enums to members if present
+            if isinstance(node_dict.get("status"), str):
+                node_dict["status"] = _to_enum(_STATUS_BY_STR, node_dict["status"])
+            if isinstance(node_dict.get("node_type"), str):
+                node_dict["node_type"] = _to_enum(_NODE_TYPE_BY_STR, node_dict["node_type"])
+
+            node = WaveNode.model_construct(**node_dict)
+            nodes[node.id] = node
+        logger.debug("Loaded %d nodes from %s", len(nodes), self._nodes_file)
+        return nodes
+
+    def _read_nodes_retrying(self) -> Dict[str, WaveNode]:
+        """
+        Read nodes from nodes.json, retrying briefly if it does not parse, as
+        another process rewriting it in place may have been caught mid-write.
+        """
+        for _ in range(_NODES_READ_ATTEMPTS - 1):
+            try:
+                return self._read_nodes()
+            except ValueError:
+                time.sleep(_NODES_READ_RETRY_DELAY)
+        return self._read_nodes()
+
+    def _get_users_cached(self) -> Dict[str, VirtualUser]:
+        """Return the users snapshot, reloading only if users.json changed on disk."""
+        now = time.monotonic()
+        if now < self._users_next_check:
+            return self._users_snapshot
+        self._users_next_check = now + self._reload_interval
+        if self._mtime_ns(self._users_file) != self._users_mtime:
+            with self._lock:
+                mtime = self._mtime_ns(self._users_file)
+                if mtime != self._users_mtime:
+                    self._users_snapshot = self._load_users()
+                    self._users_mtime = mtime
+        return self._users_snapshot
+
+    def _get_nodes_snapshot(self, force_check: bool = False) -> _NodesSnapshot:
+        """
+        Return the nodes snapshot, reloading only if nodes.json changed on disk.
+
+        The mtime is checked at most once per reload interval unless
+        force_check is set, which writers use to avoid saving over changes
+        made by another process.
+        """
+        now = time.monotonic()
+        if not force_check and now < self._nodes_next_check:
+            return self._nodes_snapshot
+        self._nodes_next_check = now + self._reload_interval
+        # While changes are pending, memory is newer than the file: don't reload
+        if not self._dirty_node_ids and self._mtime_ns(self._nodes_file) != self._nodes_mtime:
+            with self._lock:
+                mtime = self._mtime_ns(self._nodes_file)
+                if not self._dirty_node_ids and mtime != self._nodes_mtime:
+                    try:
+                        nodes = self._read_nodes_retrying()
+                    except Exception as e:
+                        # Likely caught another process mid-write; keep the
+                        # current snapshot and retry on the next access
+                        logger.warning("Error reloading nodes, keeping cached nodes: %s", e)
+                        return self._nodes_snapshot
+                    self._nodes_snapshot = _NodesSnapshot.build(nodes)
+                    self._nodes_mtime = mtime
+                    # The file may have been replaced rather than rewritten
+                    self._close_nodes_fp()
+        return self._nodes_snapshot
+
+    def _get_nodes_cached(self) -> Dict[str, WaveNode]:
+        return self._get_nodes_snapshot().nodes
+
+    def _working_copy_locked(self) -> Dict[str, WaveNode]:
+        """Return a mutable copy of the nodes for a writer holding the lock."""
+        return dict(self._get_nodes_snapshot(force_check=True).nodes)
 
     def _save_users(self, users: Dict[str, VirtualUser]):
-        """Save users to users.json atomically."""
+        """Publish users as the new snapshot and save them to users.json atomically."""
+        self._users_snapshot = users
         try:
             users_data = [{"username": user.username} for user in users.values()]
-            self._write_json_atomic(self._users_file, users_data)
+            self._write_json_atomic(self._users_file, users_data, fsync=self._durable)
+            self._users_mtime = self._mtime_ns(self._users_file)
             logger.debug("Saved %d users to %s", len(users_data), self._users_file)
         except Exception as e:
             logger.error("Error saving users: %s", e)
 
-    def _save_nodes(self, nodes: Dict[str, WaveNode]):
-        """Save nodes to nodes.json atomically."""
+    def _encode_node_row(self, node: WaveNode) -> bytes:
+        """Encode one node as it appears inside the nodes.json list."""
+        if not self._pretty:
+            return orjson.dumps(node.model_dump(mode='json'))
+        row = orjson.dumps(node.model_dump(mode='json'), option=orjson.OPT_INDENT_2)
+        # Nest one level deeper, as if dumped as part of the whole list
+        return b"  " + row.replace(b"\n", b"\n  ")
+
+    def _save_nodes(self, nodes: Dict[str, WaveNode], changed_ids: Iterable[str]):
+        """
+        Publish nodes as the new snapshot and save them to nodes.json.
+
+        Durable repositories write (atomically) before returning; otherwise
+        the write is scheduled flush_delay seconds later, and further saves
+        until then are written together.
+        """
+        self._nodes_snapshot = _NodesSnapshot.build(nodes)
+        self._dirty_node_ids.update(changed_ids)
+        if self._durable:
+            self._flush_nodes_locked()
+        else:
+            self._schedule_flush_locked()
+
+    def _schedule_flush_locked(self):
+        """Start the flush timer unless one is already pending. The caller must hold the lock."""
+        if self._flush_timer is None:
+            self._flush_timer = Timer(self._flush_delay, self.flush_now)
+            self._flush_timer.start()
+
+    def _rebase_pending_locked(self, dirty_ids: Set[str]) -> bool:
+        """
+        Re-read nodes.json after another process wrote it and reapply only the
+        pending changes to dirty_ids on top, so that process's changes to other
+        nodes are kept. Returns False if the file cannot be read. The caller
+        must hold the lock.
+        """
+        # The file may have been replaced rather than rewritten
+        self._close_nodes_fp()
         try:
-            nodes_data = []
-            for node in nodes.values():
-                nodes_data.append(
-                    {
-                        'name': node.name,
-                        'id': node.id,
-                        'node_type': node.node_type.name,
-                        'status': node.status.name,
-                        'real_time_consumption': node.real_time_consumption,
-                        'endpoint': node.endpoint,
-                        'assigned_user': node.assigned_user
-                    }
-                )
-            self._write_json_atomic(self._nodes_file, nodes_data)
-            logger.debug("Saved %d nodes to %s", len(nodes_data), self._nodes_file)
+            nodes = self._read_nodes_retrying()
+        except Exception as e:
+            logger.warning("nodes.json was changed by another process but cannot be read, "
+                           "retrying the save later: %s", e)
+            return False
+        pending = self._nodes_snapshot.nodes
+        for node_id in dirty_ids:
+            if node_id in nodes:
+                nodes[node_id] = pending[node_id]
+            else:
+                logger.warning("Node '%s' is no longer in nodes.json, dropping its pending changes", node_id)
+        self._nodes_snapshot = _NodesSnapshot.build(nodes)
+        logger.info("Merged %d pending node changes with changes made by another process", len(dirty_ids))
+        return True
+
+    def _flush_nodes_locked(self):
+        """Write the current nodes snapshot to nodes.json. The caller must hold the lock."""
+        dirty_ids = self._dirty_node_ids
+        self._dirty_node_ids = set()
+        try:
+            if self._mtime_ns(self._nodes_file) != self._nodes_mtime and not self._rebase_pending_locked(dirty_ids):
+                # Writing now would discard the other process's changes
+                self._dirty_node_ids |= dirty_ids
+                self._schedule_flush_locked()
+                return
+            nodes = self._nodes_snapshot.nodes
+            rows: Dict[str, Tuple[WaveNode, bytes]] = {}
+            encoded = 0
+            for node_id, node in nodes.items():
+                row = self._node_rows.get(node_id)
+                if row is None or row[0] is not node:
+                    row = (node, self._encode_node_row(node))
+                    encoded += 1
+                rows[node_id] = row
+            self._node_rows = rows
+
+            if not rows:
+                payload = b"[]"
+            elif self._pretty:
+                payload = b"[\n" + b",\n".join(row[1] for row in rows.values()) + b"\n]"
+            else:
+                payload = b"[" + b",".join(row[1] for row in rows.values()) + b"]"
+            if self._durable:
+                # An open handle would block os.replace on Windows; the next
+                # in-place write reopens it
+                self._close_nodes_fp()
+                self._write_bytes_atomic(self._nodes_file, payload, fsync=True)
+                self._fsync_dir()
+            else:
+                self._write_nodes_in_place(payload)
+            self._nodes_mtime = self._mtime_ns(self._nodes_file)
+            logger.debug("Saved %d nodes (%d re-encoded) to %s", len(rows), encoded, self._nodes_file)
         except Exception as e:
             logger.error("Error saving nodes: %s", e)
 
+    def flush_now(self):
+        """Write pending node changes to nodes.json now instead of after the flush delay."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty_node_ids:
+                self._flush_nodes_locked()
+
     # ---------------------------
     # Node operations
     # ---------------------------
 
     def get_all_nodes(self) -> List[WaveNode]:
         """Get all WaveNodes."""
-        with self._lock:
-            nodes = self._load_nodes()
-            return list(nodes.values())
+        nodes = self._get_nodes_cached()
+        return list(nodes.values())
 
     def get_node_by_id(self, node_id: str) -> Optional[WaveNode]:
         """Get a WaveNode by its ID."""
-        with self._lock:
-            nodes = self._load_nodes()
-            return nodes.get(node_id)
+        nodes = self._get_nodes_cached()
+        return nodes.get(node_id)
 
     def get_node_by_name(self, node_name: str) -> Optional[WaveNode]:
         """Get a WaveNode by its name."""
-        with self._lock:
-            nodes = self._load_nodes()
-            for node in nodes.values():
-                if node.name == node_name:
-                    return node
+        nodes = self._get_nodes_cached()
+        for node in nodes.values():
+            if node.name == node_name:
+                return node
+        return None
+
+    def _mutate_locked(self, nodes: Dict[str, WaveNode], node_id: str,
+                       field_updates: Dict[str, Any]) -> Optional[WaveNode]:
+        """
+        Replace a node in a working copy of the nodes with a validated, updated copy.
+
+        The caller must hold the lock, pass a copy from _working_copy_locked
+        and save it afterwards.
+
+        Raises:
+            ValidationError: if the updated node is not a valid WaveNode
+        """
+        node = nodes.get(node_id)
+        if node is None:
             return None
+        updated = WaveNode.model_validate({**node.model_dump(), **field_updates})
+        nodes[node_id] = updated
+        return updated
+
+    def apply_node_updates(self, updates: List[Tuple[str, Dict[str, Any]]]) -> List[Optional[WaveNode]]:
+        """
+        Apply several node updates under one lock and a single save.
+
+        Args:
+            updates: List of (node_id, field_updates) pairs, applied in order
+
+        Returns:
+            The updated node for each pair, or None if the node was not found
+
+        Raises:
+            ValueError: if an update names an unknown field or the id, or
+                produces an invalid node; no update is applied in that case
+        """
+        for node_id, field_updates in updates:
+            unknown = set(field_updates) - WaveNode.model_fields.keys()
+            if unknown:
+                raise ValueError(f"Unknown WaveNode fields for '{node_id}': {sorted(unknown)}")
+            if "id" in field_updates:
+                raise ValueError(f"The id of WaveNode '{node_id}' cannot be updated")
+
+        with self._lock:
+            nodes = self._working_copy_locked()
+            results = [self._mutate_locked(nodes, node_id, field_updates) for node_id, field_updates in updates]
+            changed_ids = [node.id for node in results if node is not None]
+            if changed_ids:
+                self._save_nodes(nodes, changed_ids)
+            logger.info("Applied %d node updates", sum(node is not None for node in results))
+            return results
 
     def update_node_endpoint(self, node_id: str, endpoint: str) -> Optional[WaveNode]:
         """Update a node's endpoint URL."""
         with self._lock:
-            nodes = self._load_nodes()
-            node = nodes.get(node_id)
+            nodes = self._working_copy_locked()
+            node = self._mutate_locked(nodes, node_id, {"endpoint": endpoint})
             if not node:
                 return None
-            node.endpoint = endpoint
-            nodes[node_id] = node
-            self._save_nodes(nodes)
+            self._save_nodes(nodes, [node_id])
             logger.info("Updated endpoint for node %s to %s", node_id, endpoint)
             return node
 
@@ -169,7 +467,7 @@ class WavesLabRepository:
             Tuple of (success: bool, message: str)
         """
         with self._lock:
-            nodes = self._load_nodes()
+            nodes = self._working_copy_locked()
             node = nodes.get(node_id)
 
             if not node:
@@ -178,16 +476,17 @@ class WavesLabRepository:
             if node.status == NodeStatus.ON:
                 return True, "already running"
 
+            field_updates: Dict[str, Any] = {"status": NodeStatus.ON}
+
             # Validate user if specified
             if user_name:
-                users = self._load_users()
+                users = self._get_users_cached()
                 if user_name not in users:
                     return False, f"User '{user_name}' not found"
-                node.assigned_user = user_name
+                field_updates["assigned_user"] = user_name
 
-            node.status = NodeStatus.ON
-            nodes[node_id] = node
-            self._save_nodes(nodes)
+            self._mutate_locked(nodes, node_id, field_updates)
+            self._save_nodes(nodes, [node_id])
             logger.info("Started node '%s'%s", node_id, f" with user '{user_name}'" if user_name else "")
             return True, f"Node '{node_id}' started successfully"
 
@@ -199,7 +498,7 @@ class WavesLabRepository:
             Tuple of (success: bool, message: str)
         """
         with self._lock:
-            nodes = self._load_nodes()
+            nodes = self._working_copy_locked()
             node = nodes.get(node_id)
 
             if not node:
@@ -208,18 +507,15 @@ class WavesLabRepository:
             if node.status == NodeStatus.OFF:
                 return True, "already stopped"
 
-            node.status = NodeStatus.OFF
-            node.assigned_user = None
-            nodes[node_id] = node
-            self._save_nodes(nodes)
+            self._mutate_locked(nodes, node_id, {"status": NodeStatus.OFF, "assigned_user": None})
+            self._save_nodes(nodes, [node_id])
             logger.info("Stopped node '%s'", node_id)
             return True, f"Node '{node_id}' stopped successfully"
 
     def get_active_nodes(self) -> List[WaveNode]:
         """Get all active (status=on) WaveNodes."""
-        with self._lock:
-            nodes = self._load_nodes()
-            return [node for node in nodes.values() if node.status == NodeStatus.ON]
+        snapshot = self._get_nodes_snapshot()
+        return [snapshot.nodes[node_id] for node_id in snapshot.active_ids]
 
     # ---------------------------
     # User operations
@@ -227,14 +523,22 @@ class WavesLabRepository:
 
     def get_all_users(self) -> List[VirtualUser]:
         """Get all VirtualUsers."""
-        with self._lock:
-            users = self._load_users()
-            return list(users.values())
+        users = self._get_users_cached()
+        return list(users.values())
 
     def get_user_by_username(self, username: str) -> Optional[VirtualUser]:
         """Get a VirtualUser by username."""
-        with self._lock:
-            users = self._load_users()
-            return users.get(username)
+        users = self._get_users_cached()
+        return users.get(username)
+
+
+@cache
+def get_repository() -> WavesLabRepository:
+    """Return the shared repository, creating it (and reading the data files) on first use."""
+    return WavesLabRepository()
+
 
-repository = WavesLabRepository()
\ No newline at end of file
+def flush_repository():
+    """Write pending changes of the shared repository, if it was created."""
+    if get_repository.cache_info().currsize:
+        get_repository().flush_now()
@@ -5,6 +5,7 @@ from typing import AsyncGenerator
 
 import uvicorn
 from fastapi import FastAPI
+from core.storage.WavesLabRepository import flush_repository
 from server.simulation.Simulation import simulation
 from server.web_api.api import api
 
@@ -16,6 +17,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     yield
     logger.info("Shutting down WavesLab simulation environment...")
     await simulation.stop()
+    flush_repository()
 
 api.app.router.lifespan_context = lifespan
 
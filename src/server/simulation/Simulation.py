@@ -1,12 +1,13 @@
 import asyncio
-from typing import List
+from datetime import datetime
+from typing import List, Set, Tuple
 
 import httpx
 import logging
 
 from core.model.WaveNode import WaveNode
-from core.storage.WavesLabRepository import repository
-from server.web_api.NodeRequest import NodeRequest
+from core.storage.WavesLabRepository import get_repository
+from server.web_api.NodeRequest import TIMESTAMP_FORMAT, encode_node_request
 
 logger = logging.getLogger(__name__)
 
@@ -17,9 +18,23 @@ class SimulationManager:
         self.running = None
         self.loop = None
         self._simulation_interval = 30
+        # Between ticks, how often to look for newly started nodes (started by
+        # the CLI in another process) so their first request is not delayed
+        # by a full interval
+        self._watch_interval = 1
+        self._max_concurrent_requests = 64
+        # Above this many nodes, payload encoding runs in a worker thread so
+        # it does not stall the event loop shared with the API
+        self._offload_encoding_threshold = 256
 
     async def start(self):
-        self.client = httpx.AsyncClient(timeout=10.0)
+        # Keep-alive outlives the tick interval so connections are reused
+        # across ticks instead of being re-established for every POST
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(10.0, connect=2.0),
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=200, keepalive_expiry=60),
+            headers={"Content-Type": "application/json"},
+        )
         self.running = True
         self.loop = asyncio.create_task(self._simulation_loop())
         logger.info("Simulation loop started")
@@ -47,14 +62,14 @@ class SimulationManager:
     async def _simulation_loop(self):
         while self.running:
             try:
-                active_nodes = repository.get_active_nodes()
+                active_nodes = get_repository().get_active_nodes()
                 if active_nodes:
                     logger.info(f"Processing {len(active_nodes)} active nodes")
                     await self._send_requests_for_nodes(active_nodes)
                 else:
                     logger.info("No active nodes to process")
 
-                await asyncio.sleep(self._simulation_interval)
+                await self._wait_for_next_tick({node.id for node in active_nodes})
             except asyncio.CancelledError:
                 logger.info("Request loop cancelled")
                 break
@@ -62,50 +77,78 @@ class SimulationManager:
                 logger.error(f"Error in request loop: {e}")
                 await asyncio.sleep(1)  # Brief pause on error
 
+    async def _wait_for_next_tick(self, processed_ids: Set[str]):
+        """
+        Wait for the simulation interval, returning early when a node outside
+        processed_ids becomes active. Starts that land within the same watch
+        interval are handled by a single tick.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._simulation_interval
+        while (remaining := deadline - loop.time()) > 0:
+            await asyncio.sleep(min(remaining, self._watch_interval))
+            if any(node.id not in processed_ids for node in get_repository().get_active_nodes()):
+                return
+
     async def _send_requests_for_nodes(self, nodes: List[WaveNode]):
-        tasks = []
+        # Encode every body before sending, so no encoding runs between awaits
+        if len(nodes) >= self._offload_encoding_threshold:
+            requests = await asyncio.to_thread(self._encode_payloads, nodes)
+        else:
+            requests = self._encode_payloads(nodes)
+
+        success_count = 0
+        error_count = 0
+        semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+
+        async def send(node: WaveNode, payload: bytes):
+            nonlocal success_count, error_count
+            try:
+                if await self._send_node_request(node, payload):
+                    success_count += 1
+                else:
+                    error_count += 1
+            finally:
+                semaphore.release()
 
+        try:
+            # Acquire before spawning so at most _max_concurrent_requests
+            # tasks exist at once, rather than one per node up front
+            async with asyncio.TaskGroup() as tg:
+                for node, payload in requests:
+                    await semaphore.acquire()
+                    tg.create_task(send(node, payload))
+        except Exception as e:
+            logger.error(f"Error in request loop: {e}")
+
+        # Log results
+        if success_count > 0:
+            logger.info(f"Successfully sent {success_count} node requests")
+        if error_count > 0:
+            logger.warning(f"Failed to send {error_count} node requests")
+
+    def _encode_payloads(self, nodes: List[WaveNode]) -> List[Tuple[WaveNode, bytes]]:
+        """Encode the NodeRequest JSON body of every node with an endpoint."""
+        # Every request of a tick carries the same timestamp, so format it once
+        timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+        requests = []
         for node in nodes:
-            if node.endpoint:
-                task = asyncio.create_task(self._send_node_request(node))
-                tasks.append(task)
-            else:
+            if not node.endpoint:
                 logger.info(f"Node '{node.name}' is active but has no endpoint URL")
-        if tasks:
-            try:
-                # Execute all requests concurrently
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-
-                # Log results
-                success_count = sum(1 for result in results if result is True)
-                error_count = len(results) - success_count
-
-                if success_count > 0:
-                    logger.info(f"Successfully sent {success_count} node requests")
-                if error_count > 0:
-                    logger.warning(f"Failed to send {error_count} node requests")
-            except Exception as e:
-                logger.error(f"Error in request loop: {e}")
+                continue
+            payload = encode_node_request(node.real_time_consumption, node.assigned_user, timestamp)
+            requests.append((node, payload))
+        return requests
 
-    async def _send_node_request(self, node: WaveNode) -> bool:
+    async def _send_node_request(self, node: WaveNode, payload: bytes) -> bool:
         """Send HTTP POST request for a single node."""
         if not self.client:
             logger.info("HTTP client is not initialized")
             return False
 
         try:
-            # Create request payload
-            request_data = NodeRequest(
-                realTimeConsumption=node.real_time_consumption,
-                username=node.assigned_user,
-            )
-
-            # Send POST request
-            response = await self.client.post(
-                node.endpoint,
-                json=request_data.model_dump(mode='json'),
-                headers={"Content-Type": "application/json"}
-            )
+            # Send POST request with the pre-encoded NodeRequest body
+            response = await self.client.post(node.endpoint, content=payload)
 
             if response.status_code == 200:
                 logger.info(f"Request sent successfully for node '{node.name}' to {node.endpoint}")
@@ -1,8 +1,11 @@
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
 
+import orjson
 from pydantic import BaseModel, Field, field_serializer
 
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 
 class NodeRequest(BaseModel):
     """Model for HTTP requests sent by active nodes."""
@@ -12,4 +15,21 @@ class NodeRequest(BaseModel):
 
     @field_serializer('timestamp')
     def serialize_timestamp(self, dt: datetime):
-        return dt.strftime('%Y-%m-%d %H:%M:%S')
+        return dt.strftime(TIMESTAMP_FORMAT)
+
+
+def encode_node_request(real_time_consumption: float, username: Optional[str],
+                        timestamp: Union[datetime, str]) -> bytes:
+    """
+    Encode a NodeRequest JSON body, as NodeRequest.model_dump(mode='json') would, without building the model.
+
+    timestamp may be given already formatted with TIMESTAMP_FORMAT, so callers
+    encoding many requests for the same moment format it only once.
+    """
+    if isinstance(timestamp, datetime):
+        timestamp = timestamp.strftime(TIMESTAMP_FORMAT)
+    return orjson.dumps({
+        "realTimeConsumption": real_time_consumption,
+        "username": username,
+        "timestamp": timestamp,
+    })
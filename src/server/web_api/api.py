@@ -4,7 +4,7 @@ from fastapi import FastAPI, HTTPException
 import logging
 
 from core.model.WaveNode import WaveNode
-from core.storage.WavesLabRepository import repository
+from core.storage.WavesLabRepository import get_repository
 from server.web_api.NodeUpdate import NodeUpdate
 
 logger = logging.getLogger(__name__)
@@ -17,7 +17,7 @@ class WaveLabAPI:
         """
         Initialize the WavesLab API application.
         """
-        self.repo = repository
+        self.repo = get_repository()
         self.app = FastAPI(
             title="WavesLab API",
             description="REST API for WavesLab household simulation environment",